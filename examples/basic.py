@@ -21,12 +21,13 @@ def main():
         wind_speed=wlll.units.WindSpeedUnit.METER_PER_SECOND,
     )
 
-    # poll sensor data / conditions
-    while True:
-        conditions = wlll.get_conditions(ip_first_device, units=units)
-        print(f"Inside temperature:  {conditions.inside.temp:.2f} °C")
-        print(f"Outside temperature: {conditions.integrated_sensor_suites[0].temp:.2f} °C")
-        time.sleep(10)
+    # poll sensor data / conditions, keep the HTTP connection open between polls
+    with wlll.Client(ip_first_device, units=units) as client:
+        while True:
+            conditions = client.get_conditions()
+            print(f"Inside temperature:  {conditions.inside.temp:.2f} °C")
+            print(f"Outside temperature: {conditions.integrated_sensor_suites[0].temp:.2f} °C")
+            time.sleep(10)
 
 
 if __name__ == "__main__":
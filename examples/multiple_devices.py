@@ -0,0 +1,39 @@
+import asyncio
+import logging
+
+import weatherlink_live_local as wlll
+
+logging.basicConfig(level=logging.INFO)
+
+
+async def main():
+    # discover in a worker thread to not block the event loop
+    devices = await asyncio.to_thread(wlll.discover)
+    print(devices)
+    if not devices:
+        print("No WeatherLink Live devices found")
+        return
+
+    # use first IP address of each device
+    ips = [device.ip_addresses[0] for device in devices]
+
+    # specify units
+    units = wlll.units.Units(
+        temperature=wlll.units.TemperatureUnit.CELSIUS,
+        pressure=wlll.units.PressureUnit.HECTOPASCAL,
+        rain=wlll.units.RainUnit.MILLIMETER,
+        wind_speed=wlll.units.WindSpeedUnit.METER_PER_SECOND,
+    )
+
+    # poll sensor data / conditions of all devices concurrently
+    while True:
+        all_conditions = await asyncio.gather(
+            *(wlll.get_conditions_async(ip, units=units) for ip in ips)
+        )
+        for ip, conditions in zip(ips, all_conditions):
+            print(f"{ip} inside temperature: {conditions.inside.temp:.2f} °C")
+        await asyncio.sleep(10)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
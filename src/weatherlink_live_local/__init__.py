@@ -2,49 +2,170 @@
 
 from __future__ import annotations
 
-import json
-import urllib.request
+import asyncio
+import functools
+import http.client
+import importlib
+import time
+from typing import TYPE_CHECKING
 
-from weatherlink_live_local import conditions, discovery, units
+from weatherlink_live_local import conditions, units
 
+if TYPE_CHECKING:
+    from weatherlink_live_local import discovery
 
-def discover(timeout: int = 1) -> list[discovery.ServiceInfo]:
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+
+def __getattr__(name: str):
+    # import discovery module (and zeroconf) lazily, only needed to discover devices
+    if name == "discovery":
+        return importlib.import_module(f"{__name__}.discovery")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_DISCOVER_CACHE: dict[
+    tuple[float, int | None, float | None], tuple[float, list[discovery.ServiceInfo]]
+] = {}
+
+
+def discover(
+    timeout: float = 1,
+    cache_ttl: float = 0,
+    expected: int | None = None,
+    quiet_period: float | None = None,
+) -> list[discovery.ServiceInfo]:
     """
     Discover all WeatherLink Live services on local network(s).
 
+    Use `discovery.Discoverer` to keep discovering in the background without reopening
+    the network sockets on every call.
+
     Args:
         timeout: Timeout in seconds
+        cache_ttl: Return the result of a previous call with the same arguments if it is not
+            older than `cache_ttl` seconds. Disabled by default.
+        expected: Return as soon as this number of services is found instead of waiting for
+            the full timeout
+        quiet_period: Return if no further service was found for this time in seconds after
+            the last one, e.g. 0.1 s in a local network
 
     Returns:
         List of found services
     """
-    return discovery.Discovery.find(timeout=timeout)
+    key = (timeout, expected, quiet_period)
+    cached = _DISCOVER_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+        return list(cached[1])
 
+    from weatherlink_live_local import discovery  # noqa: PLC0415
 
-def parse_response(json_str: str, units: units.Units) -> conditions.Conditions:
+    service_infos = discovery.Discovery.find(
+        timeout=timeout, expected=expected, quiet_period=quiet_period
+    )
+    # age of the result counts from the end of the discovery
+    _DISCOVER_CACHE[key] = (time.monotonic(), service_infos)
+    return list(service_infos)
+
+
+def parse_response(json_str: str | bytes, units: units.Units) -> conditions.Conditions:
     """
     Parse JSON response from WeatherLink Live API.
 
+    Uses `orjson` for decoding if installed, otherwise the standard library `json` module.
+
     Args:
-        json_str: Raw JSON response as str
+        json_str: Raw JSON response as str or bytes
         units: Units of the conditions
 
     Returns:
         Conditions of all available sensors
+
+    Raises:
+        RuntimeError: If the response reports an API error
     """
-    json_dict = json.loads(json_str)
+    json_dict = _json_loads(json_str)
+    error = json_dict.get("error")
+    if error is not None:
+        raise RuntimeError(f"WeatherLink Live API error: {error}")
     return conditions.Conditions.from_dict(json_dict["data"], units)
 
 
+class Client:
+    """
+    Client to repeatedly read conditions from a WeatherLink Live device.
+
+    The HTTP connection is kept open between requests to avoid a new TCP handshake per poll.
+    Close it with `close` or use the client as a context manager.
+
+    Args:
+        ip: IP address of WeatherLink Live device.
+            Use `discover` function to find devices with their IP address in the local network.
+        units: Units of the conditions
+        port: Port number of HTTP interface, should be 80
+        timeout: Timeout in seconds for connection and response
+    """
+
+    def __init__(self, ip: str, units: units.Units, port: int = 80, timeout: float = 1):
+        self._connection = http.client.HTTPConnection(ip, port, timeout=timeout)
+        self._units = units
+
+    def __enter__(self) -> Client:  # noqa: PYI034
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _request(self) -> tuple[int, bytes]:
+        self._connection.request("GET", "/v1/current_conditions")
+        resp = self._connection.getresponse()
+        return resp.status, resp.read()
+
+    def get_conditions(self) -> conditions.Conditions:
+        """
+        Read conditions from WeatherLink Live device + all connected sensors.
+
+        Returns:
+            Conditions of all available sensors
+        """
+        try:
+            status, body = self._request()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # kept-alive connection was closed by the device, reconnect once
+            self._connection.close()
+            try:
+                status, body = self._request()
+            except Exception:
+                self._connection.close()
+                raise
+        except Exception:
+            self._connection.close()
+            raise
+
+        if status != 200:
+            raise RuntimeError(f"HTTP response code {status}")
+
+        return parse_response(body, self._units)
+
+    def close(self) -> None:
+        """Close the HTTP connection."""
+        self._connection.close()
+
+
 def get_conditions(
     ip: str,
     units: units.Units,
     port: int = 80,
-    timeout: int = 1,
+    timeout: float = 1,
 ) -> conditions.Conditions:
     """
     Read conditions from WeatherLink Live device + all connected sensors.
 
+    Opens a new connection on every call, use `Client` to poll a device repeatedly.
+
     Args:
         ip: IP address of WeatherLink Live device.
             Use `discover` function to find devices with their IP address in the local network.
@@ -55,10 +176,33 @@ def get_conditions(
     Returns:
         Conditions of all available sensors
     """
-    url = f"http://{ip}:{port}/v1/current_conditions"
-    with urllib.request.urlopen(url, timeout=timeout) as resp:  # noqa: S310
-        if resp.status != 200:
-            raise RuntimeError(f"HTTP response code {resp.status}")
+    with Client(ip, units, port=port, timeout=timeout) as client:
+        return client.get_conditions()
+
+
+async def get_conditions_async(
+    ip: str,
+    units: units.Units,
+    port: int = 80,
+    timeout: float = 1,
+) -> conditions.Conditions:
+    """
+    Read conditions from WeatherLink Live device + all connected sensors asynchronously.
+
+    The blocking request runs in the default executor of the event loop, so multiple devices
+    can be polled concurrently, e.g. with `asyncio.gather`.
+
+    Args:
+        ip: IP address of WeatherLink Live device.
+            Use `discover` function to find devices with their IP address in the local network.
+        units: Units of the conditions
+        port: Port number of HTTP interface, should be 80
+        timeout: Timeout in seconds for connection and response
 
-        json_str = resp.read().decode("utf-8")
-        return parse_response(json_str, units)
+    Returns:
+        Conditions of all available sensors
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(get_conditions, ip, units, port=port, timeout=timeout)
+    )
@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from enum import IntEnum
-from typing import Any
+from functools import cache, lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from weatherlink_live_local.units import (
+    PRESSURE_SCALE,
+    RAIN_SCALE,
+    TEMPERATURE_SCALE_OFFSET,
+    WIND_SPEED_SCALE,
     Units,
-    convert_pressure,
-    convert_rain,
-    convert_temperature,
-    convert_wind_speed,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
 # fmt: off
 
 class DataStructureType(IntEnum):
@@ -26,15 +31,38 @@ class DataStructureType(IntEnum):
     INSIDE = 4
 
 
-@dataclass
+def _to_builtin(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, IntEnum):
+        return value.value
+    return value
+
+
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Dataclass field names, computed once per class."""
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(field.name for field in fields(cls))
+    return names
+
+
+@dataclass(frozen=True, slots=True)
 class _SensorIdentifier:
     """Sensor identifier used by all *Condition classes."""
 
     lsid: int  #: Logical sensor ID
 
-    @classmethod
-    def from_dict(cls, json_data: dict[str, Any], units: Units):  # noqa: ARG003
-        return cls(lsid=json_data["lsid"])
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to dict of plain values, e.g. for JSON serialization.
+
+        Timestamps are converted to ISO 8601 strings, enums to their integer values.
+        """
+        return {name: _to_builtin(getattr(self, name)) for name in _field_names(type(self))}
 
 
 class RadioReceptionState(IntEnum):
@@ -45,28 +73,118 @@ class RadioReceptionState(IntEnum):
     SCANNING = 2  #: Transmitter has not been acquired yet, or we've lost it (more than 15 missed packets in a row)
 
 
-@dataclass
-class _WirelessSensorUnit:
+_RX_STATES = tuple(RadioReceptionState)  # values 0, 1, 2 match the tuple index
+
+
+def _rx_state(value: int | None) -> RadioReceptionState | None:
+    if value is None:
+        return None
+    if not 0 <= value < len(_RX_STATES):
+        raise ValueError(f"{value!r} is not a valid RadioReceptionState")
+    return _RX_STATES[value]
+
+
+@dataclass(frozen=True, slots=True)
+class _WirelessSensorUnit(_SensorIdentifier):
     """Wireless sensor unit information."""
 
     txid: int  #: Transmitter ID
     rx_state: RadioReceptionState | None  #: Radio reception state
     trans_battery_flag: int  #: Transmitter battery flag
 
-    @classmethod
-    def from_dict(cls, json_data: dict[str, Any], units: Units):  # noqa: ARG003
-        return cls(
-            txid=json_data["txid"],
-            rx_state=(
-                None if json_data["rx_state"] is None
-                else RadioReceptionState(json_data["rx_state"])
-            ),
-            trans_battery_flag=json_data["trans_battery_flag"],
-        )
+
+# rain collector size in inches by `rain_size`, unknown/reserved sizes raise `KeyError`
+_RAIN_SIZE_INCHES = {
+    1: 0.01,  # 0.01"
+    2: 0.2 / 25.4,  # 0.2 mm
+    3: 0.1 / 25.4,  # 0.1 mm
+    4: 0.001,  # 0.001"
+}
+
+
+def _scaled(value: float | None, factor: float) -> float | None:
+    if value is None:
+        return None
+    return value * factor
+
+
+def _identity(value: float | None) -> float | None:
+    return value
+
+
+def _linear(scale: float, offset: float = 0.0) -> Callable[[float | None], float | None]:
+    """Specialize the affine conversion to fixed factors."""
+    if scale == 1 and offset == 0:
+        return _identity  # units match the wire format, nothing to convert
+
+    def convert(value: float | None) -> float | None:
+        if value is None:
+            return None
+        return value * scale + offset
+
+    return convert
 
 
-@dataclass
-class SensorSuiteConditions(_SensorIdentifier, _WirelessSensorUnit):
+class _Converters(NamedTuple):
+    temperature: Callable[[float | None], float | None]
+    pressure: Callable[[float | None], float | None]
+    wind_speed: Callable[[float | None], float | None]
+    rain_scale: float
+
+
+@cache
+def _converters(units: Units) -> _Converters:
+    """Unit converters specialized once per `Units`, shared by all parsers."""
+    return _Converters(
+        temperature=_linear(*TEMPERATURE_SCALE_OFFSET[units.temperature]),
+        pressure=_linear(PRESSURE_SCALE[units.pressure]),
+        wind_speed=_linear(WIND_SPEED_SCALE[units.wind_speed]),
+        rain_scale=RAIN_SCALE[units.rain],
+    )
+
+
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=128)
+def _ts_to_datetime(timestamp: int) -> datetime:
+    # storm timestamps rarely change between polls, datetime objects are immutable
+    return datetime.fromtimestamp(timestamp, _UTC)
+
+
+def _to_datetime(timestamp: int | None) -> datetime | None:
+    if timestamp is None:
+        return None
+    return _ts_to_datetime(timestamp)
+
+
+# fetch all keys of a data structure in a single C-level call
+_get_sensor_suite_fields = itemgetter(
+    "lsid", "txid", "rx_state", "trans_battery_flag", "rain_size",
+    "temp", "hum", "dew_point", "wet_bulb", "heat_index", "wind_chill", "thw_index", "thsw_index",
+    "wind_speed_last", "wind_speed_avg_last_1_min", "wind_speed_avg_last_2_min",
+    "wind_speed_avg_last_10_min", "wind_speed_hi_last_2_min", "wind_speed_hi_last_10_min",
+    "wind_dir_last", "wind_dir_scalar_avg_last_1_min", "wind_dir_scalar_avg_last_2_min",
+    "wind_dir_scalar_avg_last_10_min", "wind_dir_at_hi_speed_last_2_min",
+    "wind_dir_at_hi_speed_last_10_min",
+    "rainfall_last_60_min", "rainfall_last_24_hr", "rainfall_daily", "rainfall_monthly",
+    "rainfall_year",
+    "rain_rate_last", "rain_rate_hi", "rain_rate_hi_last_15_min",
+    "rain_storm_last", "rain_storm_last_start_at", "rain_storm_last_end_at",
+    "solar_rad", "uv_index",
+)
+_get_moisture_temperature_fields = itemgetter(
+    "lsid", "txid", "rx_state", "trans_battery_flag",
+    "temp_1", "temp_2", "temp_3", "temp_4",
+    "moist_soil_1", "moist_soil_2", "moist_soil_3", "moist_soil_4",
+    "wet_leaf_1", "wet_leaf_2",
+)
+_get_barometric_fields = itemgetter("lsid", "bar_absolute", "bar_sea_level", "bar_trend")
+_get_inside_fields = itemgetter("lsid", "temp_in", "hum_in", "dew_point_in", "heat_index_in")
+
+
+@dataclass(frozen=True, slots=True)
+class SensorSuiteConditions(_WirelessSensorUnit):
     """
     Conditions of integrated sensor suite (ISS), e.g. Vantage Vue.
 
@@ -115,71 +233,74 @@ class SensorSuiteConditions(_SensorIdentifier, _WirelessSensorUnit):
 
     @classmethod
     def from_dict(cls, json_data: dict[str, Any], units: Units):
-        rain_size_inches = {
-            1: 0.01,  # 0.01"
-            2: 0.2 / 25.4,  # 0.2 mm
-            3: 0.1 / 25.4,  # 0.1 mm
-            4: 0.001,  # 0.001"
-        }[json_data["rain_size"]]
-
-        def counts_to_inch(counts: int | None) -> float | None:
-            if counts is None:
-                return None
-            return counts * rain_size_inches
-
-        def to_datetime(timestamp: int | None) -> datetime | None:
-            if timestamp is None:
-                return None
-            return datetime.fromtimestamp(timestamp, timezone.utc)
-
-        assert json_data["data_structure_type"] == DataStructureType.SENSOR_SUITE
+        temperature, _, wind_speed, rain_scale = _converters(units)
+        (
+            lsid, txid, rx_state, trans_battery_flag, rain_size,
+            temp, hum, dew_point, wet_bulb, heat_index, wind_chill, thw_index, thsw_index,
+            wind_speed_last, wind_speed_avg_last_1_min, wind_speed_avg_last_2_min,
+            wind_speed_avg_last_10_min, wind_speed_hi_last_2_min, wind_speed_hi_last_10_min,
+            wind_dir_last, wind_dir_scalar_avg_last_1_min, wind_dir_scalar_avg_last_2_min,
+            wind_dir_scalar_avg_last_10_min, wind_dir_at_hi_speed_last_2_min,
+            wind_dir_at_hi_speed_last_10_min,
+            rainfall_last_60_min, rainfall_last_24_hr, rainfall_daily, rainfall_monthly,
+            rainfall_year,
+            rain_rate_last, rain_rate_hi, rain_rate_hi_last_15_min,
+            rain_storm_last, rain_storm_last_start_at, rain_storm_last_end_at,
+            solar_rad, uv_index,
+        ) = _get_sensor_suite_fields(json_data)
+
+        # rain counts -> inch -> selected unit in a single multiplication
+        rain_factor = _RAIN_SIZE_INCHES[rain_size] * rain_scale
+
         return cls(
-            **asdict(_SensorIdentifier.from_dict(json_data, units)),
-            **asdict(_WirelessSensorUnit.from_dict(json_data, units)),
-            temp=convert_temperature(json_data["temp"], units.temperature),
-            hum=json_data["hum"],
-            dew_point=convert_temperature(json_data["dew_point"], units.temperature),
-            wet_bulb=convert_temperature(json_data["wet_bulb"], units.temperature),
-            heat_index=convert_temperature(json_data["heat_index"], units.temperature),
-            wind_chill=convert_temperature(json_data["wind_chill"], units.temperature),
-            thw_index=convert_temperature(json_data["thw_index"], units.temperature),
-            thsw_index=convert_temperature(json_data["thsw_index"], units.temperature),
-
-            wind_speed_last=convert_wind_speed(json_data["wind_speed_last"], units.wind_speed),
-            wind_speed_avg_last_1_min=convert_wind_speed(json_data["wind_speed_avg_last_1_min"], units.wind_speed),
-            wind_speed_avg_last_2_min=convert_wind_speed(json_data["wind_speed_avg_last_2_min"], units.wind_speed),
-            wind_speed_avg_last_10_min=convert_wind_speed(json_data["wind_speed_avg_last_10_min"], units.wind_speed),
-            wind_speed_hi_last_2_min=convert_wind_speed(json_data["wind_speed_hi_last_2_min"], units.wind_speed),
-            wind_speed_hi_last_10_min=convert_wind_speed(json_data["wind_speed_hi_last_10_min"], units.wind_speed),
-
-            wind_dir_last=json_data["wind_dir_last"],
-            wind_dir_scalar_avg_last_1_min=json_data["wind_dir_scalar_avg_last_1_min"],
-            wind_dir_scalar_avg_last_2_min=json_data["wind_dir_scalar_avg_last_2_min"],
-            wind_dir_scalar_avg_last_10_min=json_data["wind_dir_scalar_avg_last_10_min"],
-            wind_dir_at_hi_speed_last_2_min=json_data["wind_dir_at_hi_speed_last_2_min"],
-            wind_dir_at_hi_speed_last_10_min=json_data["wind_dir_at_hi_speed_last_10_min"],
-
-            rainfall_last_60_min=convert_rain(counts_to_inch(json_data["rainfall_last_60_min"]), units.rain),
-            rainfall_last_24_hr=convert_rain(counts_to_inch(json_data["rainfall_last_24_hr"]), units.rain),
-            rainfall_daily=convert_rain(counts_to_inch(json_data["rainfall_daily"]), units.rain),
-            rainfall_monthly=convert_rain(counts_to_inch(json_data["rainfall_monthly"]), units.rain),
-            rainfall_year=convert_rain(counts_to_inch(json_data["rainfall_year"]), units.rain),
-
-            rain_rate_last=convert_rain(counts_to_inch(json_data["rain_rate_last"]), units.rain),
-            rain_rate_hi_last_1_min=convert_rain(counts_to_inch(json_data["rain_rate_hi"]), units.rain),
-            rain_rate_hi_last_15_min=convert_rain(counts_to_inch(json_data["rain_rate_hi_last_15_min"]), units.rain),
-
-            rain_storm_last=convert_rain(counts_to_inch(json_data["rain_storm_last"]), units.rain),
-            rain_storm_last_start_at=to_datetime(json_data["rain_storm_last_start_at"]),
-            rain_storm_last_end_at=to_datetime(json_data["rain_storm_last_end_at"]),
-
-            solar_rad=json_data["solar_rad"],
-            uv_index=json_data["uv_index"],
+            lsid=lsid,
+            txid=txid,
+            rx_state=_rx_state(rx_state),
+            trans_battery_flag=trans_battery_flag,
+            temp=temperature(temp),
+            hum=hum,
+            dew_point=temperature(dew_point),
+            wet_bulb=temperature(wet_bulb),
+            heat_index=temperature(heat_index),
+            wind_chill=temperature(wind_chill),
+            thw_index=temperature(thw_index),
+            thsw_index=temperature(thsw_index),
+
+            wind_speed_last=wind_speed(wind_speed_last),
+            wind_speed_avg_last_1_min=wind_speed(wind_speed_avg_last_1_min),
+            wind_speed_avg_last_2_min=wind_speed(wind_speed_avg_last_2_min),
+            wind_speed_avg_last_10_min=wind_speed(wind_speed_avg_last_10_min),
+            wind_speed_hi_last_2_min=wind_speed(wind_speed_hi_last_2_min),
+            wind_speed_hi_last_10_min=wind_speed(wind_speed_hi_last_10_min),
+
+            wind_dir_last=wind_dir_last,
+            wind_dir_scalar_avg_last_1_min=wind_dir_scalar_avg_last_1_min,
+            wind_dir_scalar_avg_last_2_min=wind_dir_scalar_avg_last_2_min,
+            wind_dir_scalar_avg_last_10_min=wind_dir_scalar_avg_last_10_min,
+            wind_dir_at_hi_speed_last_2_min=wind_dir_at_hi_speed_last_2_min,
+            wind_dir_at_hi_speed_last_10_min=wind_dir_at_hi_speed_last_10_min,
+
+            rainfall_last_60_min=_scaled(rainfall_last_60_min, rain_factor),
+            rainfall_last_24_hr=_scaled(rainfall_last_24_hr, rain_factor),
+            rainfall_daily=_scaled(rainfall_daily, rain_factor),
+            rainfall_monthly=_scaled(rainfall_monthly, rain_factor),
+            rainfall_year=_scaled(rainfall_year, rain_factor),
+
+            rain_rate_last=_scaled(rain_rate_last, rain_factor),
+            rain_rate_hi_last_1_min=_scaled(rain_rate_hi, rain_factor),
+            rain_rate_hi_last_15_min=_scaled(rain_rate_hi_last_15_min, rain_factor),
+
+            rain_storm_last=_scaled(rain_storm_last, rain_factor),
+            rain_storm_last_start_at=_to_datetime(rain_storm_last_start_at),
+            rain_storm_last_end_at=_to_datetime(rain_storm_last_end_at),
+
+            solar_rad=solar_rad,
+            uv_index=uv_index,
         )
 
 
-@dataclass
-class MoistureTemperatureConditions(_SensorIdentifier, _WirelessSensorUnit):
+@dataclass(frozen=True, slots=True)
+class MoistureTemperatureConditions(_WirelessSensorUnit):
     """
     Conditions of leaf & soil moisture/temperature station.
 
@@ -199,24 +320,32 @@ class MoistureTemperatureConditions(_SensorIdentifier, _WirelessSensorUnit):
 
     @classmethod
     def from_dict(cls, json_data: dict[str, Any], units: Units):
-        assert json_data["data_structure_type"] == DataStructureType.MOISTURE_TEMPERATURE
+        temperature, *_ = _converters(units)
+        (
+            lsid, txid, rx_state, trans_battery_flag,
+            temp_1, temp_2, temp_3, temp_4,
+            moist_soil_1, moist_soil_2, moist_soil_3, moist_soil_4,
+            wet_leaf_1, wet_leaf_2,
+        ) = _get_moisture_temperature_fields(json_data)
         return cls(
-            **asdict(_SensorIdentifier.from_dict(json_data, units)),
-            **asdict(_WirelessSensorUnit.from_dict(json_data, units)),
-            temp_1=convert_temperature(json_data["temp_1"], units.temperature),
-            temp_2=convert_temperature(json_data["temp_2"], units.temperature),
-            temp_3=convert_temperature(json_data["temp_3"], units.temperature),
-            temp_4=convert_temperature(json_data["temp_4"], units.temperature),
-            moist_soil_1=json_data["moist_soil_1"],
-            moist_soil_2=json_data["moist_soil_2"],
-            moist_soil_3=json_data["moist_soil_3"],
-            moist_soil_4=json_data["moist_soil_4"],
-            wet_leaf_1=json_data["wet_leaf_1"],
-            wet_leaf_2=json_data["wet_leaf_2"],
+            lsid=lsid,
+            txid=txid,
+            rx_state=_rx_state(rx_state),
+            trans_battery_flag=trans_battery_flag,
+            temp_1=temperature(temp_1),
+            temp_2=temperature(temp_2),
+            temp_3=temperature(temp_3),
+            temp_4=temperature(temp_4),
+            moist_soil_1=moist_soil_1,
+            moist_soil_2=moist_soil_2,
+            moist_soil_3=moist_soil_3,
+            moist_soil_4=moist_soil_4,
+            wet_leaf_1=wet_leaf_1,
+            wet_leaf_2=wet_leaf_2,
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BarometricConditions(_SensorIdentifier):
     """
     Barometric conditions of WeatherLink Live station.
@@ -230,16 +359,17 @@ class BarometricConditions(_SensorIdentifier):
 
     @classmethod
     def from_dict(cls, json_data: dict[str, Any], units: Units):
-        assert json_data["data_structure_type"] == DataStructureType.BAROMETRIC
+        _, pressure, *_ = _converters(units)
+        lsid, bar_absolute, bar_sea_level, bar_trend = _get_barometric_fields(json_data)
         return cls(
-            **asdict(_SensorIdentifier.from_dict(json_data, units)),
-            bar_absolute=convert_pressure(json_data["bar_absolute"], units.pressure),
-            bar_sea_level=convert_pressure(json_data["bar_sea_level"], units.pressure),
-            bar_trend=convert_pressure(json_data["bar_trend"], units.pressure),
+            lsid=lsid,
+            bar_absolute=pressure(bar_absolute),
+            bar_sea_level=pressure(bar_sea_level),
+            bar_trend=pressure(bar_trend),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InsideConditions(_SensorIdentifier):
     """
     Inside conditions of WeatherLink Live station.
@@ -254,17 +384,18 @@ class InsideConditions(_SensorIdentifier):
 
     @classmethod
     def from_dict(cls, json_data: dict[str, Any], units: Units):
-        assert json_data["data_structure_type"] == DataStructureType.INSIDE
+        temperature, *_ = _converters(units)
+        lsid, temp_in, hum_in, dew_point_in, heat_index_in = _get_inside_fields(json_data)
         return cls(
-            **asdict(_SensorIdentifier.from_dict(json_data, units)),
-            temp=convert_temperature(json_data["temp_in"], units.temperature),
-            hum=json_data["hum_in"],
-            dew_point=convert_temperature(json_data["dew_point_in"], units.temperature),
-            heat_index=convert_temperature(json_data["heat_index_in"], units.temperature),
+            lsid=lsid,
+            temp=temperature(temp_in),
+            hum=hum_in,
+            dew_point=temperature(dew_point_in),
+            heat_index=temperature(heat_index_in),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Conditions:
     """
     Gathered conditions of all available sensors.
@@ -278,30 +409,76 @@ class Conditions:
     moisture_temperature_stations: list[MoistureTemperatureConditions]  #: Conditions of leaf & soil moisture/temperature station(s)
     integrated_sensor_suites: list[SensorSuiteConditions]  #: Conditions of integrated sensor suite(s), e.g. Vantage Vue
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to dict of plain values, e.g. for JSON serialization.
+
+        Faster than `dataclasses.asdict`, which deep-copies all values.
+        Timestamps are converted to ISO 8601 strings, enums to their integer values.
+        """
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "inside": self.inside.to_dict(),
+            "barometric": self.barometric.to_dict(),
+            "moisture_temperature_stations": [c.to_dict() for c in self.moisture_temperature_stations],
+            "integrated_sensor_suites": [c.to_dict() for c in self.integrated_sensor_suites],
+        }
+
     @classmethod
     def from_dict(cls, json_data: dict[str, Any], units: Units):
-        def conditions_by_type(data_structure_type: DataStructureType):
-            return filter(
-                lambda c: c["data_structure_type"] == data_structure_type,
-                json_data["conditions"],
-            )
+        conditions_by_type: dict[int, list[dict[str, Any]]] = {t: [] for t in DataStructureType}
+        for c in json_data["conditions"]:
+            conditions_by_type.setdefault(c["data_structure_type"], []).append(c)
 
         return cls(
-            timestamp=datetime.fromtimestamp(json_data["ts"], timezone.utc),
+            timestamp=datetime.fromtimestamp(json_data["ts"], _UTC),
             inside=InsideConditions.from_dict(
-                next(conditions_by_type(DataStructureType.INSIDE)),
+                conditions_by_type[DataStructureType.INSIDE][0],
                 units
             ),
             barometric=BarometricConditions.from_dict(
-                next(conditions_by_type(DataStructureType.BAROMETRIC)),
+                conditions_by_type[DataStructureType.BAROMETRIC][0],
                 units
             ),
             moisture_temperature_stations=[
                 MoistureTemperatureConditions.from_dict(c, units)
-                for c in conditions_by_type(DataStructureType.MOISTURE_TEMPERATURE)
+                for c in conditions_by_type[DataStructureType.MOISTURE_TEMPERATURE]
             ],
             integrated_sensor_suites=[
                 SensorSuiteConditions.from_dict(c, units)
-                for c in conditions_by_type(DataStructureType.SENSOR_SUITE)
+                for c in conditions_by_type[DataStructureType.SENSOR_SUITE]
             ],
         )
+
+
+def _flatten(conditions: Conditions) -> dict[str, Any]:
+    row: dict[str, Any] = {"timestamp": conditions.timestamp}
+    for name in ("inside", "barometric"):
+        sensor = getattr(conditions, name)
+        for field_name in _field_names(type(sensor)):
+            row[f"{name}.{field_name}"] = getattr(sensor, field_name)
+    for name in ("moisture_temperature_stations", "integrated_sensor_suites"):
+        for index, sensor in enumerate(getattr(conditions, name)):
+            for field_name in _field_names(type(sensor)):
+                row[f"{name}.{index}.{field_name}"] = getattr(sensor, field_name)
+    return row
+
+
+def to_columns(samples: Iterable[Conditions]) -> dict[str, list[Any]]:
+    """
+    Collect conditions of multiple polls column-wise, e.g. for logging or numerical analysis.
+
+    Columns are named by the attribute path, e.g. `inside.temp` or `integrated_sensor_suites.0.temp`
+    for the first integrated sensor suite. Missing values (e.g. sensors not present in every
+    sample) are `None`. Columns can be converted to NumPy arrays with
+    `numpy.asarray(column, dtype=float)`, mapping `None` to `nan`.
+
+    Args:
+        samples: Conditions of multiple polls
+
+    Returns:
+        Dict of column name and list of values
+    """
+    rows = [_flatten(conditions) for conditions in samples]
+    names = dict.fromkeys(name for row in rows for name in row)
+    return {name: [row.get(name) for row in rows] for name in names}
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import zeroconf
@@ -11,7 +14,7 @@ import zeroconf
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceInfo:
     """WeatherLink Live service information."""
 
@@ -27,36 +30,163 @@ class Discovery(zeroconf.ServiceListener):
 
     TYPE = "_weatherlinklive._tcp.local."
 
-    def __init__(self):
+    def __init__(self, expected: int | None = None):
         self.services: set[str] = set()
+        self.expected = expected
+        self._last_added: float | None = None
+        self._condition = threading.Condition()
 
     # pylint: disable=unused-argument
     def add_service(self, zc: zeroconf.Zeroconf, type_: str, name: str) -> None:  # noqa: ARG002
         logger.info("Found WeatherLink Live service '%s'", name)
-        self.services.add(name)
+        with self._condition:
+            self.services.add(name)
+            self._last_added = time.monotonic()
+            self._condition.notify_all()
 
-    def remove_service(self, zc: zeroconf.Zeroconf, type_: str, name: str) -> None: ...
+    def remove_service(self, zc: zeroconf.Zeroconf, type_: str, name: str) -> None:  # noqa: ARG002
+        logger.info("Lost WeatherLink Live service '%s'", name)
+        with self._condition:
+            self.services.discard(name)
 
     def update_service(self, zc: zeroconf.Zeroconf, type_: str, name: str) -> None: ...
 
+    def wait(self, timeout: float, quiet_period: float | None = None) -> None:
+        """
+        Wait for services to be found.
+
+        Returns early once the `expected` number of services is found or, if `quiet_period` is
+        given, when no further service was found for `quiet_period` seconds after the last one.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+            quiet_period: Time in seconds without new services to consider the discovery complete
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self.expected is None or len(self.services) < self.expected:
+                end = deadline
+                if quiet_period is not None and self._last_added is not None:
+                    end = min(end, self._last_added + quiet_period)
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._condition.wait(remaining)
+
     @classmethod
-    def find(cls, timeout: float) -> list[ServiceInfo]:
-        zc = zeroconf.Zeroconf()
-        listener = cls()
+    def find(
+        cls,
+        timeout: float,
+        expected: int | None = None,
+        quiet_period: float | None = None,
+        zc: zeroconf.Zeroconf | None = None,
+    ) -> list[ServiceInfo]:
+        """
+        Find services within `timeout` seconds.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+            expected: Return as soon as this number of services is found
+            quiet_period: Return if no further service was found for this time in seconds
+            zc: Zeroconf instance to reuse across calls, must be closed by the caller.
+                A temporary instance is created (and closed) if not given.
+        """
+        zc_owned = zc is None
+        if zc is None:
+            zc = zeroconf.Zeroconf()
+        listener = cls(expected)
         browser = zeroconf.ServiceBrowser(zc, cls.TYPE, listener=listener)
+        try:
+            listener.wait(timeout, quiet_period)  # wait for responses
+            return _get_service_infos(zc, set(listener.services))
+        finally:
+            browser.cancel()
+            if zc_owned:
+                zc.close()
+
+
+_MAX_RESOLVE_WORKERS = 8
+
+
+def _get_service_info(zc: zeroconf.Zeroconf, name: str) -> zeroconf.ServiceInfo | None:
+    return zc.get_service_info(Discovery.TYPE, name)
+
+
+def _get_service_infos(zc: zeroconf.Zeroconf, names: set[str]) -> list[ServiceInfo]:
+    if not names:
+        return []
+    names_sorted = sorted(names)
+    if len(names_sorted) > 1:
+        # resolve concurrently, each query waits for its own response
+        max_workers = min(len(names_sorted), _MAX_RESOLVE_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            zc_service_infos = list(
+                executor.map(functools.partial(_get_service_info, zc), names_sorted)
+            )
+    else:
+        zc_service_infos = [_get_service_info(zc, name) for name in names_sorted]
+
+    service_infos = []
+    for name, zc_service_info in zip(names_sorted, zc_service_infos, strict=True):
+        if zc_service_info is None or zc_service_info.port is None:
+            logger.warning("Could not resolve WeatherLink Live service '%s'", name)
+            continue
+        service_infos.append(
+            ServiceInfo(
+                name=zc_service_info.name,
+                ip_addresses=zc_service_info.parsed_addresses(),
+                port=zc_service_info.port,
+            )
+        )
+    return service_infos
+
+
+class Discoverer:
+    """
+    Long-lived discovery of WeatherLink Live services on local network(s).
+
+    Keeps the zeroconf instance and service browser alive between calls, so repeated lookups
+    don't reopen the multicast sockets. Close it with `close` or use it as a context manager:
+
+    >>> with Discoverer() as discoverer:
+    ...     services = discoverer.refresh(timeout=1)
+
+    Args:
+        expected: Let `refresh` return as soon as this number of services is found
+    """
 
-        time.sleep(timeout)  # wait for responses
-
-        def get_service_infos():
-            for name in sorted(listener.services):
-                zc_service_info = zc.get_service_info(cls.TYPE, name)
-                yield ServiceInfo(
-                    name=zc_service_info.name,
-                    ip_addresses=zc_service_info.parsed_addresses(),
-                    port=zc_service_info.port,
-                )
-
-        service_infos = list(get_service_infos())
-        browser.cancel()
-        zc.close()
-        return service_infos
+    def __init__(self, expected: int | None = None):
+        self._zc = zeroconf.Zeroconf()
+        self._listener = Discovery(expected)
+        self._browser = zeroconf.ServiceBrowser(self._zc, Discovery.TYPE, listener=self._listener)
+
+    def __enter__(self) -> Discoverer:  # noqa: PYI034
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def get_services(self) -> list[ServiceInfo]:
+        """
+        Resolve the services found so far.
+
+        Blocks while querying the service information, up to 3 seconds per unresponsive service.
+        """
+        return _get_service_infos(self._zc, set(self._listener.services))
+
+    def refresh(self, timeout: float, quiet_period: float | None = None) -> list[ServiceInfo]:
+        """
+        Wait for further responses and return all found services.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+            quiet_period: Return if no further service was found for this time in seconds after
+                the last one
+        """
+        self._listener.wait(timeout, quiet_period)
+        return self.get_services()
+
+    def close(self) -> None:
+        """Stop browsing and release the zeroconf instance."""
+        self._browser.cancel()
+        self._zc.close()
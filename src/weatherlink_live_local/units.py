@@ -34,7 +34,7 @@ class WindSpeedUnit(Enum):
     MILES_PER_HOUR = 2  #: Miles per hour mi/h
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Units:
     """Units for conditions (defaults: imperial system)."""
 
@@ -44,37 +44,56 @@ class Units:
     wind_speed: WindSpeedUnit = WindSpeedUnit.MILES_PER_HOUR  #: Wind speed unit
 
 
+# (fahrenheit - 32) * 5 / 9 folded into a single multiply-add
+_F_TO_C_SCALE = 5 / 9
+_F_TO_C_OFFSET = -32 * 5 / 9
+
+#: Conversion (scale, offset) from Fahrenheit: value * scale + offset
+TEMPERATURE_SCALE_OFFSET = {
+    TemperatureUnit.CELSIUS: (_F_TO_C_SCALE, _F_TO_C_OFFSET),
+    TemperatureUnit.FAHRENHEIT: (1.0, 0.0),
+}
+#: Conversion scale from inches of mercury
+PRESSURE_SCALE = {
+    PressureUnit.HECTOPASCAL: 33.86389,
+    PressureUnit.INCH_MERCURY: 1.0,
+}
+#: Conversion scale from inches
+RAIN_SCALE = {
+    RainUnit.MILLIMETER: 25.4,
+    RainUnit.INCH: 1.0,
+}
+#: Conversion scale from miles per hour
+WIND_SPEED_SCALE = {
+    WindSpeedUnit.METER_PER_SECOND: 0.44704,
+    WindSpeedUnit.MILES_PER_HOUR: 1.0,
+}
+
+
 def convert_temperature(fahrenheit: float | None, unit: TemperatureUnit) -> float | None:
     """Convert imperial temperature (Fahrenheit) to selected unit."""
-    if fahrenheit is None:
-        return None
-    if unit == TemperatureUnit.CELSIUS:
-        return (fahrenheit - 32) * 5 / 9
-    return fahrenheit
+    if fahrenheit is None or unit == TemperatureUnit.FAHRENHEIT:
+        return fahrenheit
+    scale, offset = TEMPERATURE_SCALE_OFFSET[unit]
+    return fahrenheit * scale + offset
 
 
 def convert_pressure(inhg: float | None, unit: PressureUnit) -> float | None:
     """Convert imperial pressure (inches of mercury) to selected unit."""
-    if inhg is None:
-        return None
-    if unit == PressureUnit.HECTOPASCAL:
-        return inhg * 33.86389
-    return inhg
+    if inhg is None or unit == PressureUnit.INCH_MERCURY:
+        return inhg
+    return inhg * PRESSURE_SCALE[unit]
 
 
 def convert_rain(inch: float | None, unit: RainUnit) -> float | None:
     """Convert imperial rain amount (inch) to selected unit."""
-    if inch is None:
-        return None
-    if unit == RainUnit.MILLIMETER:
-        return inch * 25.4
-    return inch
+    if inch is None or unit == RainUnit.INCH:
+        return inch
+    return inch * RAIN_SCALE[unit]
 
 
 def convert_wind_speed(mph: float | None, unit: WindSpeedUnit) -> float | None:
     """Convert imperial wind speed (miles per hour) to selected unit."""
-    if mph is None:
-        return None
-    if unit == WindSpeedUnit.METER_PER_SECOND:
-        return mph * 0.44704
-    return mph
+    if mph is None or unit == WindSpeedUnit.MILES_PER_HOUR:
+        return mph
+    return mph * WIND_SPEED_SCALE[unit]
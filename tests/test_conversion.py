@@ -1,9 +1,11 @@
 import pytest
 
+from weatherlink_live_local.conditions import _converters, _identity
 from weatherlink_live_local.units import (
     PressureUnit,
     RainUnit,
     TemperatureUnit,
+    Units,
     WindSpeedUnit,
     convert_pressure,
     convert_rain,
@@ -60,3 +62,25 @@ def test_convert_rain(raw, inch, mm):
 def test_convert_wind_speed(raw, mph, ms):
     assert convert_wind_speed(raw, WindSpeedUnit.MILES_PER_HOUR) == mph
     assert convert_wind_speed(raw, WindSpeedUnit.METER_PER_SECOND) == pytest.approx(ms, rel=RTOL)
+
+
+def test_convert_imperial_passthrough():
+    # values in the imperial wire format are returned unchanged, e.g. ints stay ints
+    assert type(convert_temperature(2, TemperatureUnit.FAHRENHEIT)) is int
+    assert type(convert_pressure(2, PressureUnit.INCH_MERCURY)) is int
+    assert type(convert_rain(2, RainUnit.INCH)) is int
+    assert type(convert_wind_speed(2, WindSpeedUnit.MILES_PER_HOUR)) is int
+
+
+def test_converters_imperial_passthrough():
+    converters = _converters(Units())
+    assert converters.temperature is _identity
+    assert converters.pressure is _identity
+    assert converters.wind_speed is _identity
+
+
+def test_converters_cached_per_units():
+    # equal Units share the same specialized converters, e.g. across polls
+    units = Units(temperature=TemperatureUnit.CELSIUS)
+    assert _converters(units) is _converters(Units(temperature=TemperatureUnit.CELSIUS))
+    assert _converters(units) is not _converters(Units())
@@ -1,200 +1,580 @@
-import re
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict
 from datetime import datetime, timezone
+from functools import cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 
-from httpretty import HTTPretty, httprettified
+import pytest
 
 import weatherlink_live_local as wlll
 
-RESPONSE_COMMENTS = """
-{
-    "data":
-    {
-        "did":"001D0A700002",
-        "ts":1531754005,
-        "conditions":[
-            {
-                "lsid":48308,                                  // logical sensor ID **(no unit)**
-                "data_structure_type":1,                       // data structure type **(no unit)**
-                "txid":1,                                      // transmitter ID **(no unit)**
-                "temp":62.7,                                   // most recent valid temperature **(°F)**
-                "hum":1.1,                                     // most recent valid humidity **(%RH)**
-                "dew_point":-0.3,                              // **(°F)**
-                "wet_bulb":null,                               // **(°F)**
-                "heat_index":5.5,                              // **(°F)**
-                "wind_chill":6.0,                              // **(°F)**
-                "thw_index":5.5,                               // **(°F)**
-                "thsw_index":5.5,                              // **(°F)**
-                "wind_speed_last":2,                           // most recent valid wind speed **(mph)**
-                "wind_dir_last":null,                          // most recent valid wind direction **(°degree)**
-                "wind_speed_avg_last_1_min":4,                 // average wind speed over last 1 min **(mph)**
-                "wind_dir_scalar_avg_last_1_min":15,           // scalar average wind direction over last 1 min **(°degree)**
-                "wind_speed_avg_last_2_min":42606,             // average wind speed over last 2 min **(mph)**
-                "wind_dir_scalar_avg_last_2_min":170.7,        // scalar average wind direction over last 2 min **(°degree)**
-                "wind_speed_hi_last_2_min":8,                  // maximum wind speed over last 2 min **(mph)**
-                "wind_dir_at_hi_speed_last_2_min":0.0,         // gust wind direction over last 2 min **(°degree)**
-                "wind_speed_avg_last_10_min":42606,            // average wind speed over last 10 min **(mph)**
-                "wind_dir_scalar_avg_last_10_min":4822.5,      // scalar average wind direction over last 10 min **(°degree)**
-                "wind_speed_hi_last_10_min":8,                 // maximum wind speed over last 10 min **(mph)**
-                "wind_dir_at_hi_speed_last_10_min":0.0,        // gust wind direction over last 10 min **(°degree)**
-                "rain_size":2,                                 // rain collector type/size **(0: Reserved, 1: 0.01", 2: 0.2 mm, 3:  0.1 mm, 4: 0.001")**
-                "rain_rate_last":0,                            // most recent valid rain rate **(counts/hour)**
-                "rain_rate_hi":null,                           // highest rain rate over last 1 min **(counts/hour)**
-                "rainfall_last_15_min":null,                   // total rain count over last 15 min **(counts)**
-                "rain_rate_hi_last_15_min":0,                  // highest rain rate over last 15 min **(counts/hour)**
-                "rainfall_last_60_min":null,                   // total rain count for last 60 min **(counts)**
-                "rainfall_last_24_hr":null,                    // total rain count for last 24 hours **(counts)**
-                "rain_storm":null,                             // total rain count since last 24 hour long break in rain **(counts)**
-                "rain_storm_start_at":null,                    // UNIX timestamp of current rain storm start **(seconds)**
-                "solar_rad":747,                               // most recent solar radiation **(W/m²)**
-                "uv_index":5.5,                                // most recent UV index **(Index)**
-                "rx_state":2,                                  // configured radio receiver state **(no unit)**
-                "trans_battery_flag":0,                        // transmitter battery status flag **(no unit)**
-                "rainfall_daily":63,                           // total rain count since local midnight **(counts)**
-                "rainfall_monthly":63,                         // total rain count since first of month at local midnight **(counts)**
-                "rainfall_year":63,                            // total rain count since first of user-chosen month at local midnight **(counts)**
-                "rain_storm_last":null,                        // total rain count since last 24 hour long break in rain **(counts)**
-                "rain_storm_last_start_at":null,               // UNIX timestamp of last rain storm start **(sec)**
-                "rain_storm_last_end_at":null                  // UNIX timestamp of last rain storm end **(sec)**
-            },
-            {
-                "lsid":3187671188,
-                "data_structure_type":2,
-                "txid":3,
-                "temp_1":null,                                 // most recent valid soil temp slot 1 **(°F)**
-                "temp_2":null,                                 // most recent valid soil temp slot 2 **(°F)**
-                "temp_3":null,                                 // most recent valid soil temp slot 3 **(°F)**
-                "temp_4":null,                                 // most recent valid soil temp slot 4 **(°F)**
-                "moist_soil_1":null,                           // most recent valid soil moisture slot 1 **(|cb|)**
-                "moist_soil_2":null,                           // most recent valid soil moisture slot 2 **(|cb|)**
-                "moist_soil_3":null,                           // most recent valid soil moisture slot 3 **(|cb|)**
-                "moist_soil_4":null,                           // most recent valid soil moisture slot 4 **(|cb|)**
-                "wet_leaf_1":null,                             // most recent valid leaf wetness slot 1 **(no unit)**
-                "wet_leaf_2":null,                             // most recent valid leaf wetness slot 2 **(no unit)**
-                "rx_state":null,                               // configured radio receiver state **(no unit)**
-                "trans_battery_flag":null                      // transmitter battery status flag **(no unit)**
-            },
-            {
-                "lsid":48307,
-                "data_structure_type":4,
-                "temp_in":78.0,                                // most recent valid inside temp **(°F)**
-                "hum_in":41.1,                                 // most recent valid inside humidity **(%RH)**
-                "dew_point_in":7.8,                            // **(°F)**
-                "heat_index_in":8.4                            // **(°F)**
-            },
-            {
-                "lsid":48306,
-                "data_structure_type":3,
-                "bar_sea_level":30.008,                        // most recent bar sensor reading with elevation adjustment **(inches)**
-                "bar_trend":null,                              // current 3 hour bar trend **(inches)**
-                "bar_absolute":30.008                          // raw bar sensor reading **(inches)**
-            }
-        ]
-    },
-    "error":null
+# example response from https://weatherlink.github.io/weatherlink-live-local-api/
+RESPONSE = (Path(__file__).parent / "fixtures" / "response.json").read_text()
+RAIN_SIZE_INCH = 0.2 / 25.4  # rain_size 2: 0.2 mm per count
+_RAINFALL_63_INCH = 63 * RAIN_SIZE_INCH
+
+_DEFAULT_UNITS = wlll.units.Units()
+_METRIC_UNITS = wlll.units.Units(
+    temperature=wlll.units.TemperatureUnit.CELSIUS,
+    pressure=wlll.units.PressureUnit.HECTOPASCAL,
+    rain=wlll.units.RainUnit.MILLIMETER,
+    wind_speed=wlll.units.WindSpeedUnit.METER_PER_SECOND,
+)
+
+
+@cache
+def _parse_response(units: wlll.units.Units) -> wlll.conditions.Conditions:
+    # conditions are immutable, safe to share the parsed RESPONSE between tests
+    return wlll.parse_response(RESPONSE, units)
+
+
+class _Server(ThreadingHTTPServer):
+    """Local WeatherLink Live HTTP server, serving `body` with `status`."""
+
+    body = RESPONSE.encode()
+    status = 200
+    # set True to drop the connection after each response without a Connection: close header
+    close_connection = False
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RequestHandler)
+        self.clients: list[tuple[str, int]] = []
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections alive
+    server: _Server
+
+    def do_GET(self):
+        assert self.path == "/v1/current_conditions"
+        self.server.clients.append(self.client_address)
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(self.server.body)
+        self.close_connection = self.server.close_connection
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    with _Server() as httpd:
+        thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        yield httpd
+        httpd.shutdown()
+
+
+_EXPECTED_TS = datetime(2018, 7, 16, 15, 13, 25, tzinfo=timezone.utc)  # "ts": 1531754005
+
+EXPECTED_INSIDE = {
+    "lsid": 48307,
+    "temp": 78,
+    "hum": 41.1,
+    "dew_point": 7.8,
+    "heat_index": 8.4,
+}
+
+EXPECTED_BAROMETRIC = {
+    "lsid": 48306,
+    "bar_sea_level": 30.008,
+    "bar_trend": None,
+    "bar_absolute": 30.008,
+}
+
+EXPECTED_MT0 = {
+    "lsid": 3187671188,
+    "txid": 3,
+    "rx_state": None,
+    "trans_battery_flag": None,
+    "temp_1": None,
+    "temp_2": None,
+    "temp_3": None,
+    "temp_4": None,
+    "moist_soil_1": None,
+    "moist_soil_2": None,
+    "moist_soil_3": None,
+    "moist_soil_4": None,
+    "wet_leaf_1": None,
+    "wet_leaf_2": None,
+}
+
+EXPECTED_ISS0 = {
+    "lsid": 48308,
+    "txid": 1,
+    "rx_state": wlll.conditions.RadioReceptionState.SCANNING,
+    "trans_battery_flag": 0,
+    "temp": 62.7,
+    "hum": 1.1,
+    "dew_point": -0.3,
+    "wet_bulb": None,
+    "heat_index": 5.5,
+    "wind_chill": 6.0,
+    "thw_index": 5.5,
+    "thsw_index": 5.5,
+    "wind_speed_last": 2,
+    "wind_speed_avg_last_1_min": 4,
+    "wind_speed_avg_last_2_min": 42606,
+    "wind_speed_avg_last_10_min": 42606,
+    "wind_speed_hi_last_2_min": 8,
+    "wind_speed_hi_last_10_min": 8,
+    "wind_dir_last": None,
+    "wind_dir_scalar_avg_last_1_min": 15,
+    "wind_dir_scalar_avg_last_2_min": 170.7,
+    "wind_dir_scalar_avg_last_10_min": 4822.5,
+    "wind_dir_at_hi_speed_last_2_min": 0.0,
+    "wind_dir_at_hi_speed_last_10_min": 0.0,
+    "rainfall_last_60_min": None,
+    "rainfall_last_24_hr": None,
+    "rainfall_daily": _RAINFALL_63_INCH,
+    "rainfall_monthly": _RAINFALL_63_INCH,
+    "rainfall_year": _RAINFALL_63_INCH,
+    "rain_rate_last": 0,
+    "rain_rate_hi_last_1_min": None,
+    "rain_rate_hi_last_15_min": 0,
+    "rain_storm_last": None,
+    "rain_storm_last_start_at": None,
+    "rain_storm_last_end_at": None,
+    "solar_rad": 747,
+    "uv_index": 5.5,
 }
-"""
 
-RESPONSE = re.sub(r"\s+//.*$", "", RESPONSE_COMMENTS, flags=re.MULTILINE)
-RAIN_SIZE_INCH = 0.2 / 25.4
 
+@pytest.fixture(scope="module")
+def conditions() -> wlll.conditions.Conditions:
+    return _parse_response(_DEFAULT_UNITS)
 
-def _counts_to_inch(counts: int) -> float:
-    return counts * RAIN_SIZE_INCH
 
+def test_parse_response(conditions):
+    assert conditions.timestamp == _EXPECTED_TS
+    assert len(conditions.moisture_temperature_stations) == 1
+    assert len(conditions.integrated_sensor_suites) == 1
 
-def test_parse_response():  # noqa: PLR0915
-    units = wlll.units.Units()
-    conditions = wlll.parse_response(RESPONSE, units)
 
-    assert conditions.timestamp == datetime.fromtimestamp(1531754005, timezone.utc)
+@pytest.mark.parametrize(
+    ("path", "cls", "expected"),
+    [
+        ("inside", wlll.conditions.InsideConditions, EXPECTED_INSIDE),
+        ("barometric", wlll.conditions.BarometricConditions, EXPECTED_BAROMETRIC),
+        (
+            "moisture_temperature_stations.0",
+            wlll.conditions.MoistureTemperatureConditions,
+            EXPECTED_MT0,
+        ),
+        ("integrated_sensor_suites.0", wlll.conditions.SensorSuiteConditions, EXPECTED_ISS0),
+    ],
+)
+def test_parse_response_sensor(conditions, path, cls, expected):
+    name, _, index = path.partition(".")
+    sensor = getattr(conditions, name)
+    if index:
+        sensor = sensor[int(index)]
+    assert isinstance(sensor, cls)
+    assert asdict(sensor) == expected
 
-    inside = conditions.inside
-    assert isinstance(inside, wlll.conditions.InsideConditions)
-    assert inside.lsid == 48307
-    assert inside.temp == 78
-    assert inside.hum == 41.1
-    assert inside.dew_point == 7.8
-    assert inside.heat_index == 8.4
 
-    barometric = conditions.barometric
-    assert isinstance(barometric, wlll.conditions.BarometricConditions)
-    assert barometric.lsid == 48306
-    assert barometric.bar_absolute == 30.008
-    assert barometric.bar_sea_level == 30.008
-    assert barometric.bar_trend is None
+def test_parse_response_grouping():
+    response = json.loads(RESPONSE)
+    sensors = response["data"]["conditions"]
+    iss = next(c for c in sensors if c["data_structure_type"] == 1)
+    sensors.append({**iss, "lsid": 1})  # second ISS
+    sensors.append({"lsid": 2, "data_structure_type": 99})  # unknown type, ignored
 
+    conditions = wlll.conditions.Conditions.from_dict(response["data"], _DEFAULT_UNITS)
+    assert [c.lsid for c in conditions.integrated_sensor_suites] == [48308, 1]
     assert len(conditions.moisture_temperature_stations) == 1
-    mt0 = conditions.moisture_temperature_stations[0]
-    assert isinstance(mt0, wlll.conditions.MoistureTemperatureConditions)
-    assert mt0.txid == 3
-    assert mt0.rx_state is None
-    assert mt0.trans_battery_flag is None
-    assert mt0.temp_1 is None
-    assert mt0.temp_2 is None
-    assert mt0.temp_3 is None
-    assert mt0.temp_4 is None
-    assert mt0.moist_soil_1 is None
-    assert mt0.moist_soil_2 is None
-    assert mt0.moist_soil_3 is None
-    assert mt0.moist_soil_4 is None
-    assert mt0.wet_leaf_1 is None
-    assert mt0.wet_leaf_2 is None
 
-    assert len(conditions.integrated_sensor_suites) == 1
-    iss0 = conditions.integrated_sensor_suites[0]
-    assert isinstance(iss0, wlll.conditions.SensorSuiteConditions)
-    assert iss0.lsid == 48308
-    assert iss0.txid == 1
-    assert iss0.rx_state == wlll.conditions.RadioReceptionState.SCANNING
-    assert iss0.trans_battery_flag == 0
-    assert iss0.temp == 62.7
-    assert iss0.hum == 1.1
-    assert iss0.dew_point == -0.3
-    assert iss0.wet_bulb is None
-    assert iss0.heat_index == 5.5
-    assert iss0.wind_chill == 6.0
-    assert iss0.thw_index == 5.5
-    assert iss0.thsw_index == 5.5
-    assert iss0.wind_speed_last == 2
-    assert iss0.wind_speed_avg_last_1_min == 4
-    assert iss0.wind_speed_avg_last_2_min == 42606
-    assert iss0.wind_speed_avg_last_10_min == 42606
-    assert iss0.wind_speed_hi_last_2_min == 8
-    assert iss0.wind_speed_hi_last_10_min == 8
-    assert iss0.wind_dir_last is None
-    assert iss0.wind_dir_scalar_avg_last_1_min == 15
-    assert iss0.wind_dir_scalar_avg_last_2_min == 170.7
-    assert iss0.wind_dir_scalar_avg_last_10_min == 4822.5
-    assert iss0.wind_dir_at_hi_speed_last_2_min == 0.0
-    assert iss0.wind_dir_at_hi_speed_last_10_min == 0.0
-    assert iss0.rainfall_last_60_min is None
-    assert iss0.rainfall_last_24_hr is None
-    assert iss0.rainfall_daily == _counts_to_inch(63)
-    assert iss0.rainfall_monthly == _counts_to_inch(63)
-    assert iss0.rainfall_year == _counts_to_inch(63)
-    assert iss0.rain_rate_last == 0
-    assert iss0.rain_rate_hi_last_1_min is None
-    assert iss0.rain_rate_hi_last_15_min == 0
-    assert iss0.rain_storm_last is None
-    assert iss0.rain_storm_last_start_at is None
-    assert iss0.rain_storm_last_end_at is None
-    assert iss0.solar_rad == 747
-    assert iss0.uv_index == 5.5
-
-
-@httprettified
-def test_get_conditions():
-    HTTPretty.register_uri(
-        HTTPretty.GET,
-        "http://127.0.0.1/v1/current_conditions",
-        body=RESPONSE,
+
+def test_parse_response_bytes_orjson():
+    orjson = pytest.importorskip("orjson")
+    assert wlll._json_loads is orjson.loads  # noqa: SLF001
+    assert wlll.parse_response(RESPONSE.encode(), _DEFAULT_UNITS) == _parse_response(_DEFAULT_UNITS)
+
+
+def test_parse_response_json_fallback(monkeypatch):
+    expected = _parse_response(_DEFAULT_UNITS)
+    monkeypatch.setattr(wlll, "_json_loads", json.loads)
+    assert wlll.parse_response(RESPONSE.encode(), _DEFAULT_UNITS) == expected
+
+
+def test_to_dict(conditions):
+    conditions_dict = conditions.to_dict()
+
+    assert json.loads(json.dumps(conditions_dict)) == conditions_dict
+    assert conditions_dict["timestamp"] == "2018-07-16T15:13:25+00:00"
+    assert conditions_dict["inside"] == {
+        "lsid": 48307,
+        "temp": 78.0,
+        "hum": 41.1,
+        "dew_point": 7.8,
+        "heat_index": 8.4,
+    }
+    assert conditions_dict["integrated_sensor_suites"][0]["rx_state"] == 2
+    assert conditions_dict["moisture_temperature_stations"][0]["rx_state"] is None
+
+
+def test_parse_response_error():
+    response = '{"data": null, "error": {"code": 409, "message": "unknown"}}'
+    with pytest.raises(RuntimeError, match="409"):
+        wlll.parse_response(response, _DEFAULT_UNITS)
+
+
+def _unique_values(data_structure_type: int, **fixed) -> dict:
+    # distinct value per key to detect keys mapped to the wrong field
+    sensor = next(
+        c
+        for c in json.loads(RESPONSE)["data"]["conditions"]
+        if c["data_structure_type"] == data_structure_type
     )
+    keys = [key for key in sensor if key not in fixed and key != "data_structure_type"]
+    return {
+        "data_structure_type": data_structure_type,
+        **fixed,
+        **{key: 100 + index for index, key in enumerate(keys)},
+    }
+
+
+def test_parse_sensor_suite_field_mapping():
+    raw = _unique_values(1, lsid=1, txid=2, rx_state=1, trans_battery_flag=3, rain_size=1)
+    iss = wlll.conditions.SensorSuiteConditions.from_dict(raw, _DEFAULT_UNITS)
+
+    rain_keys = {
+        "rainfall_last_60_min",
+        "rainfall_last_24_hr",
+        "rainfall_daily",
+        "rainfall_monthly",
+        "rainfall_year",
+        "rain_rate_last",
+        "rain_rate_hi",
+        "rain_rate_hi_last_15_min",
+        "rain_storm_last",
+    }
+    timestamp_keys = {"rain_storm_last_start_at", "rain_storm_last_end_at"}
+    field_names = {"rain_rate_hi": "rain_rate_hi_last_1_min"}
+    expected = {}
+    for key, value in raw.items():
+        if key in timestamp_keys:
+            value = datetime.fromtimestamp(value, timezone.utc)  # noqa: PLW2901
+        elif key in rain_keys:
+            value = value * 0.01  # noqa: PLW2901
+        expected[field_names.get(key, key)] = value
+    expected["rx_state"] = wlll.conditions.RadioReceptionState.SYNCED
+
+    fields = asdict(iss)
+    assert fields == {name: expected[name] for name in fields}
 
-    units = wlll.units.Units(
-        temperature=wlll.units.TemperatureUnit.CELSIUS,
-        pressure=wlll.units.PressureUnit.HECTOPASCAL,
-        rain=wlll.units.RainUnit.MILLIMETER,
-        wind_speed=wlll.units.WindSpeedUnit.METER_PER_SECOND,
+
+def test_parse_moisture_temperature_field_mapping():
+    raw = _unique_values(2, lsid=1, txid=2, rx_state=0, trans_battery_flag=3)
+    mt = wlll.conditions.MoistureTemperatureConditions.from_dict(raw, _DEFAULT_UNITS)
+
+    expected = {**raw, "rx_state": wlll.conditions.RadioReceptionState.SYNCED_TRACKING}
+    fields = asdict(mt)
+    assert fields == {name: expected[name] for name in fields}
+
+
+def test_parse_rain_storm_timestamps():
+    response = json.loads(RESPONSE)
+    iss = next(c for c in response["data"]["conditions"] if c["data_structure_type"] == 1)
+    iss["rain_storm_last_start_at"] = 1531700000
+    iss["rain_storm_last_end_at"] = 1531750000
+
+    first = wlll.conditions.Conditions.from_dict(response["data"], _DEFAULT_UNITS)
+    second = wlll.conditions.Conditions.from_dict(response["data"], _DEFAULT_UNITS)
+    iss0 = first.integrated_sensor_suites[0]
+
+    assert iss0.rain_storm_last_start_at == datetime(2018, 7, 16, 0, 13, 20, tzinfo=timezone.utc)
+    assert iss0.rain_storm_last_end_at == datetime(2018, 7, 16, 14, 6, 40, tzinfo=timezone.utc)
+    assert iss0.rain_storm_last_start_at.tzinfo is timezone.utc
+    # equal timestamps of consecutive polls share the cached datetime
+    assert (
+        second.integrated_sensor_suites[0].rain_storm_last_start_at is iss0.rain_storm_last_start_at
     )
-    conditions = wlll.get_conditions("127.0.0.1", units)
-    assert conditions == wlll.parse_response(RESPONSE, units)
+    assert second.integrated_sensor_suites[0].rain_storm_last_end_at is iss0.rain_storm_last_end_at
+
+    iss0_dict = iss0.to_dict()
+    assert iss0_dict["rain_storm_last_start_at"] == "2018-07-16T00:13:20+00:00"
+    assert iss0_dict["rain_storm_last_end_at"] == "2018-07-16T14:06:40+00:00"
+
+
+@pytest.mark.parametrize("rx_state", [-1, 3])
+def test_parse_response_invalid_rx_state(rx_state):
+    response = json.loads(RESPONSE)
+    iss = next(c for c in response["data"]["conditions"] if c["data_structure_type"] == 1)
+    iss["rx_state"] = rx_state
+    with pytest.raises(ValueError, match="RadioReceptionState"):
+        wlll.conditions.Conditions.from_dict(response["data"], _DEFAULT_UNITS)
+
+
+@pytest.mark.parametrize("rain_size", [0, -1, 5])
+def test_parse_response_invalid_rain_size(rain_size):
+    response = json.loads(RESPONSE)
+    iss = next(c for c in response["data"]["conditions"] if c["data_structure_type"] == 1)
+    iss["rain_size"] = rain_size
+    with pytest.raises(KeyError):
+        wlll.conditions.Conditions.from_dict(response["data"], _DEFAULT_UNITS)
+
+
+def test_get_conditions(server):
+    conditions = wlll.get_conditions("127.0.0.1", _METRIC_UNITS, port=server.port)
+    assert conditions == _parse_response(_METRIC_UNITS)
+
+
+def test_discover_cache(monkeypatch):
+    services = [wlll.discovery.ServiceInfo(name="test", ip_addresses=["127.0.0.1"], port=80)]
+    calls = []
+
+    def find(timeout, expected, quiet_period):
+        calls.append((timeout, expected, quiet_period))
+        return services
+
+    monkeypatch.setattr(wlll.discovery.Discovery, "find", find)
+    monkeypatch.setattr(wlll, "_DISCOVER_CACHE", {})
+
+    assert wlll.discover(timeout=0.1) == services
+    assert wlll.discover(timeout=0.1) == services
+    assert len(calls) == 2  # cache disabled by default
+
+    assert wlll.discover(timeout=0.1, cache_ttl=60) == services
+    assert len(calls) == 2
+    assert wlll.discover(timeout=0.2, cache_ttl=60) == services
+    assert len(calls) == 3
+
+
+def test_discover_cache_ttl_after_discovery(monkeypatch):
+    calls = []
+
+    def find(timeout, expected, quiet_period):  # noqa: ARG001
+        calls.append(timeout)
+        time.sleep(timeout)
+        return []
+
+    monkeypatch.setattr(wlll.discovery.Discovery, "find", find)
+    monkeypatch.setattr(wlll, "_DISCOVER_CACHE", {})
+
+    # cache age starts when the discovery has finished, not when it was started
+    wlll.discover(timeout=0.1, cache_ttl=0.05)
+    wlll.discover(timeout=0.1, cache_ttl=0.05)
+    assert len(calls) == 1
+
+
+def test_client(server):
+    with wlll.Client("127.0.0.1", _DEFAULT_UNITS, port=server.port) as client:
+        assert client.get_conditions() == _parse_response(_DEFAULT_UNITS)
+        assert client.get_conditions() == _parse_response(_DEFAULT_UNITS)
+
+    assert len(server.clients) == 2
+    assert len(set(server.clients)) == 1  # same (kept-alive) connection
+
+
+def test_client_reconnect(server):
+    server.close_connection = True
+
+    with wlll.Client("127.0.0.1", _DEFAULT_UNITS, port=server.port) as client:
+        assert client.get_conditions() == _parse_response(_DEFAULT_UNITS)
+        time.sleep(0.05)  # let the server close the connection
+        assert client.get_conditions() == _parse_response(_DEFAULT_UNITS)
+
+    assert len(server.clients) == 2
+    assert len(set(server.clients)) == 2  # reconnected
+
+
+def test_client_http_error(server):
+    server.status = 500
+    server.body = b""
+
+    client = wlll.Client("127.0.0.1", _DEFAULT_UNITS, port=server.port)
+    with client, pytest.raises(RuntimeError, match="500"):
+        client.get_conditions()
+
+
+def test_get_conditions_async(server):
+    conditions = asyncio.run(
+        wlll.get_conditions_async("127.0.0.1", _DEFAULT_UNITS, port=server.port)
+    )
+    assert conditions == _parse_response(_DEFAULT_UNITS)
+
+
+def test_to_columns(conditions):
+    samples = [conditions] * 3
+    columns = wlll.conditions.to_columns(samples)
+
+    assert columns["timestamp"] == [_EXPECTED_TS] * 3
+    assert columns["inside.temp"] == [78] * 3
+    assert columns["barometric.bar_trend"] == [None] * 3
+    assert columns["integrated_sensor_suites.0.lsid"] == [48308] * 3
+    assert columns["moisture_temperature_stations.0.wet_leaf_2"] == [None] * 3
+    assert all(len(column) == 3 for column in columns.values())
+
+
+def test_to_columns_missing_sensors(conditions):
+    response = json.loads(RESPONSE)
+    sensors = response["data"]["conditions"]
+    iss = next(c for c in sensors if c["data_structure_type"] == 1)
+    sensors[:] = [c for c in sensors if c["data_structure_type"] != 2]  # no moisture station
+    sensors.append({**iss, "lsid": 1})  # second ISS
+    other = wlll.conditions.Conditions.from_dict(response["data"], _DEFAULT_UNITS)
+
+    columns = wlll.conditions.to_columns([conditions, other, conditions])
+
+    assert columns["moisture_temperature_stations.0.lsid"] == [3187671188, None, 3187671188]
+    assert columns["integrated_sensor_suites.0.lsid"] == [48308, 48308, 48308]
+    assert columns["integrated_sensor_suites.1.lsid"] == [None, 1, None]
+    assert all(len(column) == 3 for column in columns.values())
+
+    # columns in order of first appearance, columns of the second ISS last
+    second_iss_names = [f"integrated_sensor_suites.1.{name}" for name in EXPECTED_ISS0]
+    assert list(columns) == [*wlll.conditions.to_columns([conditions]), *second_iss_names]
+
+
+def test_discovery_wait_expected():
+    listener = wlll.discovery.Discovery(expected=2)
+    listener.add_service(None, wlll.discovery.Discovery.TYPE, "a")
+    listener.add_service(None, wlll.discovery.Discovery.TYPE, "b")
+
+    start = time.monotonic()
+    listener.wait(timeout=10)
+    assert time.monotonic() - start < 1
+
+
+def test_discovery_wait_quiet_period():
+    listener = wlll.discovery.Discovery()
+    listener.add_service(None, wlll.discovery.Discovery.TYPE, "a")
+
+    start = time.monotonic()
+    listener.wait(timeout=10, quiet_period=0.05)
+    assert time.monotonic() - start < 1
+
+
+def test_discovery_wait_timeout():
+    listener = wlll.discovery.Discovery()
+    start = time.monotonic()
+    listener.wait(timeout=0.05, quiet_period=0.01)  # quiet period only counts after first service
+    assert time.monotonic() - start >= 0.05
+
+
+class _FakeServiceInfo:
+    def __init__(self, name):
+        self.name = name
+        self.port = 80
+
+    def parsed_addresses(self):
+        return ["127.0.0.1"]
+
+
+class _FakeZeroconf:
+    """Zeroconf stand-in, services named "unresolved" can't be resolved."""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.closed = False
+
+    def get_service_info(self, type_, name):  # noqa: ARG002
+        time.sleep(self.delay)
+        return None if name == "unresolved" else _FakeServiceInfo(name)
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeServiceBrowser:
+    """ServiceBrowser stand-in, announces `names` when created."""
+
+    names: tuple[str, ...] = ()
+
+    def __init__(self, zc, type_, listener):
+        self.listener = listener
+        self.cancelled = False
+        for name in self.names:
+            listener.add_service(zc, type_, name)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def test_discovery_get_service_infos_concurrent():
+    zc = _FakeZeroconf(delay=0.2)
+    start = time.monotonic()
+    service_infos = wlll.discovery._get_service_infos(zc, {"b", "a", "unresolved"})  # noqa: SLF001
+    assert time.monotonic() - start < 0.5
+    assert [service_info.name for service_info in service_infos] == ["a", "b"]
+    assert wlll.discovery._get_service_infos(zc, set()) == []  # noqa: SLF001
+
+
+def test_discovery_find_reuse_zeroconf(monkeypatch):
+    monkeypatch.setattr(_FakeServiceBrowser, "names", ("unresolved",))
+    monkeypatch.setattr(wlll.discovery.zeroconf, "ServiceBrowser", _FakeServiceBrowser)
+    zc = _FakeZeroconf()
+    assert wlll.discovery.Discovery.find(timeout=0.01, zc=zc) == []
+    assert not zc.closed
+
+
+@pytest.fixture
+def discoverer(monkeypatch):
+    monkeypatch.setattr(wlll.discovery.zeroconf, "Zeroconf", _FakeZeroconf)
+    monkeypatch.setattr(wlll.discovery.zeroconf, "ServiceBrowser", _FakeServiceBrowser)
+    with wlll.discovery.Discoverer(expected=2) as discoverer:
+        yield discoverer
+
+
+def test_discoverer_add_remove(discoverer):
+    listener = discoverer._browser.listener  # noqa: SLF001
+    assert discoverer.get_services() == []
+
+    listener.add_service(None, wlll.discovery.Discovery.TYPE, "b")
+    listener.add_service(None, wlll.discovery.Discovery.TYPE, "a")
+    assert [service.name for service in discoverer.get_services()] == ["a", "b"]
+
+    listener.remove_service(None, wlll.discovery.Discovery.TYPE, "a")
+    assert [service.name for service in discoverer.get_services()] == ["b"]
+
+
+def test_discoverer_refresh(discoverer):
+    listener = discoverer._browser.listener  # noqa: SLF001
+    start = time.monotonic()
+    assert discoverer.refresh(timeout=0.05) == []
+    assert time.monotonic() - start >= 0.05
+
+    listener.add_service(None, wlll.discovery.Discovery.TYPE, "a")
+    listener.add_service(None, wlll.discovery.Discovery.TYPE, "b")
+    start = time.monotonic()
+    assert len(discoverer.refresh(timeout=10)) == 2  # expected number of services found
+    assert time.monotonic() - start < 1
+
+
+def test_discoverer_refresh_quiet_period(monkeypatch):
+    monkeypatch.setattr(wlll.discovery.zeroconf, "Zeroconf", _FakeZeroconf)
+    monkeypatch.setattr(_FakeServiceBrowser, "names", ("a",))
+    monkeypatch.setattr(wlll.discovery.zeroconf, "ServiceBrowser", _FakeServiceBrowser)
+    with wlll.discovery.Discoverer() as discoverer:
+        start = time.monotonic()
+        assert len(discoverer.refresh(timeout=10, quiet_period=0.05)) == 1
+        assert time.monotonic() - start < 1
+
+
+def test_discoverer_close(monkeypatch):
+    monkeypatch.setattr(wlll.discovery.zeroconf, "Zeroconf", _FakeZeroconf)
+    monkeypatch.setattr(wlll.discovery.zeroconf, "ServiceBrowser", _FakeServiceBrowser)
+    with wlll.discovery.Discoverer() as discoverer:
+        browser, zc = discoverer._browser, discoverer._zc  # noqa: SLF001
+        assert not browser.cancelled
+        assert not zc.closed
+    assert browser.cancelled
+    assert zc.closed
+
+
+def test_lazy_import_discovery():
+    code = "import sys, weatherlink_live_local; assert 'zeroconf' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603